@@ -0,0 +1,290 @@
+import asyncio
+from typing import Any, Dict
+from urllib.parse import urlencode
+
+import httpx
+import orjson
+import requests
+from requests.exceptions import HTTPError, JSONDecodeError, RequestException
+from requests.structures import CaseInsensitiveDict
+
+from cryptohandler import (
+    URL_COIN_TMPL,
+    URL_COINS_LIST,
+    URL_GLOBAL,
+    URL_MARKETS,
+    URL_SIMPLE_PRICE,
+    URL_SUPPORTED_CURRENCIES,
+    CoinList,
+    CoinLookupMixin,
+    coingecko_api_key,
+)
+
+
+def _to_requests_response(response: httpx.Response) -> requests.Response:
+    """
+    Converts an httpx response into a requests Response, so errors carry the same response type as CryptoHandler's.
+
+    Args:
+        response (httpx.Response): The fully read httpx response.
+
+    Returns:
+        requests.Response: A response with the same status, headers, URL, and body.
+    """
+    converted = requests.Response()
+    converted.status_code = response.status_code
+    converted.reason = response.reason_phrase
+    converted.headers = CaseInsensitiveDict(response.headers)
+    converted.url = str(response.url)
+    converted.encoding = response.encoding
+    converted._content = response.content
+    return converted
+
+
+class AsyncCryptoHandler(CoinLookupMixin):
+    """
+    Asynchronous counterpart of CryptoHandler for issuing many CoinGecko requests concurrently.
+
+    Instances must be created with the `create` classmethod, which opens the shared HTTP session and
+    fetches the supported currency lists in parallel. The session speaks HTTP/2, so concurrent requests
+    are multiplexed over a single TLS connection to CoinGecko.
+
+    Errors are raised as the same requests exception types CryptoHandler uses, and an HTTPError carries
+    the response converted to a requests Response. Unlike CryptoHandler, the messages are not prefixed
+    with the name of the public method that failed.
+    """
+
+    def __init__(self, base_currency: str = "usd"):
+        self.base_currency = base_currency
+        self.supported_currencies: frozenset[str] = frozenset()
+        self.supported_crypto_currencies = CoinList((), (), ())
+        self._id_to_idx: dict[str, int] = {}
+        self._session: httpx.AsyncClient | None = None
+        # Request URL -> the task currently fetching it, shared by every concurrent caller of that URL.
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    @classmethod
+    async def create(cls, base_currency: str = "usd") -> "AsyncCryptoHandler":
+        """
+        Creates a handler, opens its HTTP session and loads the supported fiat and crypto currencies.
+
+        Args:
+            base_currency (str): The default fiat currency code (default: "usd").
+
+        Returns:
+            AsyncCryptoHandler: A ready to use handler.
+
+        Raises:
+            HTTPError: If the HTTP request returns an unsuccessful status code.
+            JSONDecodeError: If the response cannot be decoded as JSON.
+            RequestException: If a network-related error occurs or the request fails for another reason.
+        """
+        handler = cls(base_currency)
+        headers = {"accept": "application/json"}
+        if coingecko_api_key is not None:
+            headers["x-cg-demo-api-key"] = coingecko_api_key
+        handler._session = httpx.AsyncClient(
+            http2=True,
+            headers=headers,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+
+        try:
+            supported_currencies, handler.supported_crypto_currencies = await asyncio.gather(
+                handler.get_supported_currencies(), handler.get_crypto_currencies()
+            )
+        except BaseException:
+            await handler.close()
+            raise
+        handler.supported_currencies = frozenset(supported_currencies)
+        handler._id_to_idx = {id: i for i, id in enumerate(handler.supported_crypto_currencies.ids)}
+
+        return handler
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """
+        Closes the underlying HTTP session and releases its pooled connections.
+        """
+        if self._session is not None:
+            await self._session.aclose()
+
+    async def _api_request(self, url: str, params: Dict[str, Any] | None = None):
+        """
+        Sends a Get request to the specified URL and returns the parsed JSON data.
+
+        Concurrent calls for the same URL and parameters are coalesced into one request, and every
+        caller receives the same parsed result. Cancelling one caller does not cancel the shared request.
+
+        Args:
+            url(str): The API endpoint URL to send the GET request to.
+            params(Dict[str, Any] | None): Optional query string parameters, URL-encoded by the session.
+
+        Returns:
+            dict: The JSON response data parsed into a dictionary.
+
+        Raises:
+            HTTPError: If the HTTP request returns an unsuccessful status code.
+            JSONDecodeError: If the response cannot be decoded as JSON.
+            RequestException: If a network-related error occurs or the request fails for another reason.
+        """
+        key = f"{url}?{urlencode(params)}" if params else url
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._fetch(url, params))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(inflight)
+
+    async def _fetch(self, url: str, params: Dict[str, Any] | None = None):
+        """
+        Sends a single Get request over the shared session and returns the parsed JSON data.
+
+        Args:
+            url(str): The API endpoint URL to send the GET request to.
+            params(Dict[str, Any] | None): Optional query string parameters, URL-encoded by the session.
+
+        Returns:
+            dict: The JSON response data parsed into a dictionary.
+
+        Raises:
+            HTTPError: If the HTTP request returns an unsuccessful status code.
+            JSONDecodeError: If the response cannot be decoded as JSON.
+            RequestException: If a network-related error occurs or the request fails for another reason.
+        """
+        try:
+            response = await self._session.get(url, params=params)
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except httpx.HTTPStatusError as e:
+            raise HTTPError(
+                f"HTTP request failed with status code {e.response.status_code} for URL: {url}",
+                response=_to_requests_response(e.response),
+            )
+        except orjson.JSONDecodeError as e:
+            raise JSONDecodeError(f"Response from {url} could not be decoded as JSON.", e.doc, e.pos)
+        except httpx.HTTPError as e:
+            raise RequestException(f"Request failed: {e} for URL: {url}")
+
+    async def get_supported_currencies(self) -> list[str]:
+        """
+        Fetches a list of supported fiat currencies from the CoinGecko API.
+
+        Returns:
+            list: A list of strings representing the supported fiat currencies.
+        """
+        return await self._api_request(url=URL_SUPPORTED_CURRENCIES)
+
+    async def get_crypto_currencies(self) -> CoinList:
+        """
+        Fetches a list of all supported cryptocurrencies, providing basic information including coin ID, name, and symbol.
+
+        Returns:
+            CoinList: The IDs, names, and symbols of all supported cryptocurrencies as parallel tuples.
+        """
+        return CoinList.from_coins(await self._api_request(url=URL_COINS_LIST))
+
+    async def get_crypto_currencies_detailed(self, base_currency: str = "usd") -> list[Dict]:
+        """
+        Fetches detailed market data for cryptocurrencies, including price, market cap, and trading volume.
+
+        Args:
+            base_currency (str): The fiat currency code to use for market data conversion (default: "usd").
+
+        Returns:
+            list[Dict]: A list of dictionaries containing detailed market data for cryptocurrencies.
+
+        Raises:
+            ValueError: If the provided base currency is not supported.
+        """
+        if base_currency not in self.supported_currencies:
+            raise ValueError(f"Unsupported currency provided: {base_currency}")
+        return await self._api_request(url=URL_MARKETS, params={"vs_currency": base_currency})
+
+    async def get_specific_crypto(self, id: str, base_currency: str = "usd") -> Dict[str, Any]:
+        """
+        Fetches the current price for a specific cryptocurrency in a specified base currency.
+
+        Args:
+            id (str): The unique ID of the cryptocurrency to fetch.
+            base_currency (str): The fiat currency code to use for price conversion (default: "usd").
+
+        Returns:
+            Dict[str, Any]: A dictionary containing the current price for the specified cryptocurrency.
+
+        Raises:
+            ValueError: If the provided cryptocurrency ID or base currency is not supported.
+        """
+        self._is_valid_crypto_id(id)
+        if base_currency not in self.supported_currencies:
+            raise ValueError(f"Unsupported currency provided: {base_currency}")
+        return await self._api_request(url=URL_SIMPLE_PRICE, params={"ids": id, "vs_currencies": base_currency})
+
+    async def get_specific_cryptos(self, ids: list[str], base_currency: str = "usd") -> list[Dict]:
+        """
+        Fetches market data for several cryptocurrencies using as few API requests as possible.
+
+        The IDs are deduplicated and split into batches of up to 250 coins for the markets endpoint,
+        and all batches are requested concurrently.
+
+        Args:
+            ids (list[str]): The unique IDs of the cryptocurrencies to fetch.
+            base_currency (str): The fiat currency code to use for market data conversion (default: "usd").
+
+        Returns:
+            list[Dict]: A list of dictionaries containing market data for each requested cryptocurrency.
+
+        Raises:
+            ValueError: If a provided cryptocurrency ID or the base currency is not supported.
+        """
+        batches = self._markets_batches(ids, base_currency)
+        chunks = await asyncio.gather(*[self._api_request(url=URL_MARKETS, params=params) for params in batches])
+        return [coin for chunk in chunks for coin in chunk]
+
+    async def get_specific_crypto_detailed(self, id: str) -> dict:
+        """
+        Fetches detailed information for a specific cryptocurrency by its unique ID.
+
+        Args:
+            id (str): The unique ID of the cryptocurrency to fetch.
+
+        Returns:
+            dict: A dictionary containing detailed information about the specified cryptocurrency.
+
+        Raises:
+            ValueError: If the provided cryptocurrency ID does not exist in the supported list.
+        """
+        self._is_valid_crypto_id(id)
+        return await self._api_request(url=URL_COIN_TMPL.format(id))
+
+    async def get_many_cryptos(self, ids: list[str]) -> list[dict]:
+        """
+        Fetches detailed information for several cryptocurrencies concurrently.
+
+        All requests are issued at once over the shared session, so the total wait is roughly
+        that of the slowest single request instead of the sum of all of them.
+
+        Args:
+            ids (list[str]): The unique IDs of the cryptocurrencies to fetch.
+
+        Returns:
+            list[dict]: The detailed information for each cryptocurrency, in the same order as `ids`.
+
+        Raises:
+            ValueError: If any of the provided cryptocurrency IDs does not exist in the supported list.
+        """
+        return await asyncio.gather(*[self.get_specific_crypto_detailed(id) for id in ids])
+
+    async def get_global_data(self) -> dict:
+        """
+        Fetches global cryptocurrency market data, including total market cap, total volume, and more.
+
+        Returns:
+            dict: A dictionary containing various global market metrics.
+        """
+        return await self._api_request(url=URL_GLOBAL)
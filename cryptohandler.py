@@ -1,37 +1,402 @@
-import json
-import logging
+import gzip
 import os
-from typing import Any, Dict
-
-import requests
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from functools import cached_property, wraps
+from typing import Any, Dict, Iterable, Iterator, NamedTuple
+from urllib.parse import urlencode
+
+import ijson
+import orjson
 from dotenv import load_dotenv
+from platformdirs import user_cache_dir
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError, JSONDecodeError, RequestException
+from requests_cache import DO_NOT_CACHE, CachedSession, SQLiteCache
+from urllib3.exceptions import HTTPError as Urllib3Error
+from urllib3.exceptions import InvalidHeader
+from urllib3.util import Retry
 
 load_dotenv(override=True)
 
 coingecko_api_key = os.getenv("COINGECKO_API_KEY")
 
+API_BASE_URL = "https://api.coingecko.com/api/v3"
+URL_SUPPORTED_CURRENCIES = f"{API_BASE_URL}/simple/supported_vs_currencies"
+URL_COINS_LIST = f"{API_BASE_URL}/coins/list"
+URL_MARKETS = f"{API_BASE_URL}/coins/markets"
+URL_SIMPLE_PRICE = f"{API_BASE_URL}/simple/price"
+URL_COIN_TMPL = API_BASE_URL + "/coins/{}"
+URL_GLOBAL = f"{API_BASE_URL}/global"
+
+# Per-user directory holding the on-disk caches, so they do not depend on the working directory.
+CACHE_DIR = user_cache_dir("cryptohandler")
+
+# Response cache lifetimes per endpoint; these override CoinGecko's Cache-Control, and anything not listed is not cached.
+_CACHE_EXPIRATIONS = {
+    "api.coingecko.com/api/v3/simple/supported_vs_currencies": timedelta(hours=24),
+    "api.coingecko.com/api/v3/coins/markets": timedelta(seconds=30),
+}
+
+# Largest number of coins the /coins/markets endpoint returns for a single page.
+MARKETS_MAX_IDS = 250
+
+# Transient failures and rate-limit responses are retried with exponential backoff, honouring Retry-After.
+# Once retries run out the last response is returned, so raise_for_status() still raises HTTPError with its status.
+_RETRY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    respect_retry_after_header=True,
+    allowed_methods=frozenset(["GET"]),
+    raise_on_status=False,
+)
+
+# Once fewer requests than this remain in the current rate-limit window, wait before sending the next one.
+RATE_LIMIT_THRESHOLD = 2
+# CoinGecko rate limits are counted per minute; used when a response gives no Retry-After.
+RATE_LIMIT_WINDOW = 60
+
+# Number of URLs whose ETag and parsed body are kept for conditional GETs; the least recently used is dropped first.
+ETAG_CACHE_SIZE = 32
+
+# Parsed /coins/list snapshot in CACHE_DIR, reused across process starts while it is younger than the TTL (seconds).
+COINS_LIST_CACHE_FILE = "coins_list.json.gz"
+COINS_LIST_CACHE_TTL = 60 * 60
+
+
+def _api_errors(method):
+    """
+    Decorates a public API method so that API errors raised inside it are re-raised with the method's name.
+
+    The error keeps its exception type and response. When decorated methods call each other, only the
+    outermost method's name ends up in the message.
+
+    Args:
+        method: The method to wrap.
+
+    Returns:
+        The wrapped method.
+    """
+
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        try:
+            return method(*args, **kwargs)
+        except RequestException as e:
+            original = getattr(e, "_api_original", e)
+            context = {"request": original.request, "response": original.response}
+            if isinstance(original, JSONDecodeError):
+                message = f"{method.__name__}: JSON decode error occurred: {original.msg}"
+                error = type(original)(message, original.doc, original.pos, **context)
+            elif isinstance(original, HTTPError):
+                error = type(original)(f"{method.__name__}: HTTP error occurred: {original}", **context)
+            else:
+                error = type(original)(f"{method.__name__}: Request error occurred: {original}", **context)
+            error._api_original = original
+            raise error from original
+
+    return wrapper
+
+
+class CoinList(NamedTuple):
+    """
+    The supported cryptocurrencies stored as parallel tuples, where the same index refers to the same coin in each field.
+    """
+
+    ids: tuple[str, ...]
+    names: tuple[str, ...]
+    symbols: tuple[str, ...]
+
+    @classmethod
+    def from_coins(cls, coins: Iterable[dict]) -> "CoinList":
+        """
+        Builds a CoinList in a single pass over coin dictionaries containing 'id', 'name', and 'symbol'.
+        """
+        ids, names, symbols = [], [], []
+        for coin in coins:
+            ids.append(coin["id"])
+            names.append(coin["name"])
+            symbols.append(coin["symbol"])
+        return cls(tuple(ids), tuple(names), tuple(symbols))
+
+
+def _load_coin_list_cache() -> CoinList | None:
+    """
+    Returns the CoinList saved by a previous run, or None if there is none, it is older than COINS_LIST_CACHE_TTL,
+    or its timestamp lies in the future.
+    """
+    try:
+        with gzip.open(os.path.join(CACHE_DIR, COINS_LIST_CACHE_FILE), "rb") as f:
+            saved_at, ids, names, symbols = orjson.loads(f.read())
+        if not 0 <= time.time() - saved_at <= COINS_LIST_CACHE_TTL:
+            return None
+        return CoinList(tuple(ids), tuple(names), tuple(symbols))
+    except (OSError, EOFError, TypeError, ValueError):
+        return None
+
+
+def _save_coin_list_cache(coins: CoinList):
+    """
+    Saves a CoinList for later runs. Failing to write the cache is not an error.
+    """
+    path = os.path.join(CACHE_DIR, COINS_LIST_CACHE_FILE)
+    tmp_path = f"{path}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with gzip.open(tmp_path, "wb") as f:
+            f.write(orjson.dumps([time.time(), coins.ids, coins.names, coins.symbols]))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+class CoinLookupMixin:
+    """
+    Coin ID validation and lookups shared by the synchronous and asynchronous handlers.
+
+    Subclasses provide `supported_currencies`, `supported_crypto_currencies` and the `_id_to_idx`
+    index mapping each supported coin ID to its position in `supported_crypto_currencies`.
+    """
+
+    def _is_valid_crypto_id(self, id: str) -> bool:
+        """
+        Checks if the provided cryptocurrency ID is valid by looking it up in
+        the index of supported cryptocurrency IDs.
+
+        Args:
+            id (str): The unique identifier for the cryptocurrency to validate.
+
+        Returns:
+            bool: True if the cryptocurrency ID exists in the supported list; otherwise, raises ValueError.
+
+        Raises:
+            ValueError: If the provided cryptocurrency ID does not exist in the supported list.
+        """
+        if id in self._id_to_idx:
+            return True
+        raise ValueError(f"Provided cryptocurrency ID '{id}' does not exist in supported list.")
+
+    def _validate_crypto_ids(self, ids: Iterable[str]) -> None:
+        """
+        Checks a batch of cryptocurrency IDs at once and reports every unsupported ID together.
+
+        The membership test runs as a single set difference against the ID index, so large watchlists
+        are validated without a Python-level lookup per ID.
+
+        Args:
+            ids (Iterable[str]): The unique identifiers of the cryptocurrencies to validate.
+
+        Raises:
+            ValueError: If any of the provided cryptocurrency IDs does not exist in the supported list.
+        """
+        unknown = set(ids).difference(self._id_to_idx)
+        if unknown:
+            raise ValueError(f"Provided cryptocurrency IDs {sorted(unknown)} do not exist in supported list.")
+
+    def get_coin_info(self, id: str) -> tuple[str, str, str]:
+        """
+        Looks up the basic information of a supported cryptocurrency without making an API request.
+
+        Args:
+            id (str): The unique ID of the cryptocurrency to look up.
+
+        Returns:
+            tuple[str, str, str]: The cryptocurrency's ID, name, and symbol.
+
+        Raises:
+            ValueError: If the provided cryptocurrency ID does not exist in the supported list.
+        """
+        self._is_valid_crypto_id(id)
+        i = self._id_to_idx[id]
+        coins = self.supported_crypto_currencies
+        return coins.ids[i], coins.names[i], coins.symbols[i]
+
+    def _markets_batches(self, ids: list[str], base_currency: str) -> list[Dict[str, Any]]:
+        """
+        Validates a watchlist and splits it into /coins/markets query parameters of up to 250 coins each.
+
+        Args:
+            ids (list[str]): The unique IDs of the cryptocurrencies to fetch; duplicates are dropped.
+            base_currency (str): The fiat currency code to use for market data conversion.
+
+        Returns:
+            list[Dict[str, Any]]: The query parameters for each markets request, in the order of `ids`.
+
+        Raises:
+            ValueError: If a provided cryptocurrency ID or the base currency is not supported.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        self._validate_crypto_ids(unique_ids)
+        if base_currency not in self.supported_currencies:
+            raise ValueError(f"Unsupported currency provided: {base_currency}")
+
+        return [
+            {
+                "vs_currency": base_currency,
+                "ids": ",".join(unique_ids[start : start + MARKETS_MAX_IDS]),
+                "per_page": MARKETS_MAX_IDS,
+            }
+            for start in range(0, len(unique_ids), MARKETS_MAX_IDS)
+        ]
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that waits before sending once CoinGecko reports the rate limit is nearly used up.
+
+    The response cache answers hits before the adapter is reached, so only requests that actually go
+    over the network are throttled or update the rate-limit state.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Requests left in the current rate-limit window and the monotonic time at which sending may resume.
+        self._rate_state: dict[str, float | None] = {"remaining": None, "resume_at": 0.0}
+
+    def send(self, request, **kwargs):
+        """
+        Sends the request after any pending rate-limit wait and records the rate-limit headers of its response.
+        """
+        self._wait_for_rate_limit()
+        response = super().send(request, **kwargs)
+        self._update_rate_state(response)
+        return response
+
+    def _wait_for_rate_limit(self):
+        """
+        Sleeps until the rate-limit window resets if the last response reported too few remaining requests.
+        """
+        remaining = self._rate_state["remaining"]
+        if remaining is not None and remaining < RATE_LIMIT_THRESHOLD:
+            delay = self._rate_state["resume_at"] - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._rate_state["remaining"] = None
+
+    def _update_rate_state(self, response):
+        """
+        Records the remaining request count and when the window resets from a response's rate-limit headers.
+
+        Args:
+            response (requests.Response): The response received from CoinGecko.
+        """
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        try:
+            self._rate_state["remaining"] = int(remaining)
+        except ValueError:
+            return
+        retry_after = response.headers.get("Retry-After")
+        try:
+            delay = RATE_LIMIT_WINDOW if retry_after is None else _RETRY.parse_retry_after(retry_after)
+        except InvalidHeader:
+            delay = RATE_LIMIT_WINDOW
+        self._rate_state["resume_at"] = time.monotonic() + delay
+
+
+class CryptoHandler(CoinLookupMixin):
+    """
+    Client for the CoinGecko API.
+
+    Results of the API methods may be shared between calls for the same URL, so treat them as read-only
+    and copy them before modifying.
+    """
 
-class CryptoHandler:
     def __init__(self, base_currency: str = "usd"):
         self.base_currency = base_currency
 
-        try:
-            self.supported_currencies = self.get_supported_currencies()
-            self.supported_crypto_currencies = self.get_crypto_currencies()
-        except (HTTPError, RequestException) as api_error:
-            logging.error(f"API or network issue: {api_error}")
-        except JSONDecodeError as json_error:
-            logging.error(f"Failed to decode JSON data while fetching supported currencies: {json_error}")
+        self._session = CachedSession(
+            backend=SQLiteCache(os.path.join(CACHE_DIR, "coingecko_cache.sqlite")),
+            expire_after=DO_NOT_CACHE,
+            urls_expire_after=_CACHE_EXPIRATIONS,
+        )
+        self._session.headers.update({"accept": "application/json", "x-cg-demo-api-key": coingecko_api_key})
+        self._session.mount("https://", RateLimitedAdapter(pool_connections=1, pool_maxsize=16, max_retries=_RETRY))
+        # Request URL -> (ETag, parsed body) of the last successful response, used for conditional GETs.
+        self._etag_cache: OrderedDict[str, tuple[str, Any]] = OrderedDict()
+
+    @cached_property
+    def supported_currencies(self) -> frozenset[str]:
+        """
+        The supported fiat currencies, fetched from the API on first access and reused afterwards.
+
+        They are kept as a frozenset so the currency check done by most methods is a hash lookup.
+
+        Raises:
+            HTTPError: If the HTTP request returns an unsuccessful status code.
+            JSONDecodeError: If the response cannot be decoded as JSON.
+            RequestException: If a network-related error occurs or the request fails for another reason.
+        """
+        return frozenset(self.get_supported_currencies())
 
-    def _api_request(self, url: str):
+    @cached_property
+    def supported_crypto_currencies(self) -> CoinList:
+        """
+        The supported cryptocurrencies, fetched from the API on first access and reused afterwards.
+
+        The parsed list is also saved to disk, and a copy younger than an hour is loaded from there
+        instead of fetching and parsing /coins/list again when a new handler starts.
+
+        Raises:
+            HTTPError: If the HTTP request returns an unsuccessful status code.
+            JSONDecodeError: If the response cannot be decoded as JSON.
+            RequestException: If a network-related error occurs or the request fails for another reason.
+        """
+        coins = _load_coin_list_cache()
+        if coins is None:
+            coins = self.get_crypto_currencies()
+            _save_coin_list_cache(coins)
+        return coins
+
+    @cached_property
+    def _id_to_idx(self) -> dict[str, int]:
+        """
+        Maps each supported coin ID to its position in the `supported_crypto_currencies` tuples.
+
+        Built lazily on first access from `supported_crypto_currencies`, so it triggers that fetch
+        (or the coin list memo lookup) if the list has not been loaded yet.
+
+        Returns:
+            dict[str, int]: The index of every supported coin ID in the parallel CoinList tuples.
+
+        Raises:
+            HTTPError: If the HTTP request returns an unsuccessful status code.
+            JSONDecodeError: If the response cannot be decoded as JSON.
+            RequestException: If a network-related error occurs or the request fails for another reason.
+        """
+        return {id: i for i, id in enumerate(self.supported_crypto_currencies.ids)}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes the underlying HTTP session and releases its pooled connections.
+        """
+        self._session.close()
+
+    def _api_request(self, url: str, params: Dict[str, Any] | None = None):
         """
         Sends a Get request to the specified URL and returns the parsed JSON data.
 
+        Requests go through a shared session so the TLS connection to CoinGecko is kept alive and reused between calls.
+        Responses are cached on disk per endpoint, and expired entries are revalidated with a conditional GET
+        using the ETag or Last-Modified header CoinGecko returned. The parsed body of every response carrying an
+        ETag is kept for the ETAG_CACHE_SIZE most recently used URLs, so a 304 or an unchanged ETag returns the
+        previous result without parsing JSON again. That result is the same object returned before and must not be mutated.
+        Transient errors are retried with exponential backoff, and the request waits first if the rate limit is nearly used up.
+
         This method is a protected utility for making API requests. It handles HTTP errors and JSON decoding issues, providing clear error messages if something goes wrong.
 
         Args:
             url(str): The API endpoint URL to send the GET request to.
+            params(Dict[str, Any] | None): Optional query string parameters, URL-encoded by the session.
 
         Returns:
             dict: The JSON response data parsed into a dictionary.
@@ -41,40 +406,72 @@ class CryptoHandler:
             JSONDecodeError: If the response cannot be decoded as JSON.
             RequestException: If a network-related error occurs or the request fails for another reason.
         """
-        headers = {"accept": "application/json", "x-cg-demo-api-key": coingecko_api_key}
-
         try:
-            response = requests.get(url, headers=headers)
+            cache_key = f"{url}?{urlencode(params)}" if params else url
+            cached = self._etag_cache.get(cache_key)
+            headers = {"If-None-Match": cached[0]} if cached else None
+
+            response = self._session.get(url, params=params, headers=headers)
+            if cached and (response.status_code == 304 or response.headers.get("ETag") == cached[0]):
+                self._etag_cache.move_to_end(cache_key)
+                return cached[1]
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
+            etag = response.headers.get("ETag")
+            if etag:
+                self._etag_cache[cache_key] = (etag, data)
+                self._etag_cache.move_to_end(cache_key)
+                if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
             return data
         except HTTPError:
-            raise HTTPError(f"HTTP request failed with status code {response.status_code} for URL: {url}")
-        except JSONDecodeError:
-            raise JSONDecodeError(f"Response from {url} could not be decoded as JSON.")
+            raise HTTPError(
+                f"HTTP request failed with status code {response.status_code} for URL: {url}", response=response
+            )
+        except orjson.JSONDecodeError as e:
+            raise JSONDecodeError(f"Response from {url} could not be decoded as JSON.", e.doc, e.pos)
         except RequestException as e:
-            raise RequestException(f"Request failed: {e} for URL: {url}")
+            raise type(e)(f"Request failed: {e} for URL: {url}", request=e.request, response=e.response)
 
-    def _is_valid_crypto_id(self, id: str) -> bool:
+    def _api_stream_items(self, url: str) -> Iterator[dict]:
         """
-        Checks if the provided cryptocurrency ID is valid by comparing it against
-        the list of supported cryptocurrencies.
+        Sends a streaming Get request to the specified URL and yields the items of the top-level JSON array.
+
+        The body is parsed incrementally while it is being read, so large list endpoints never have to be
+        held in memory as a whole. The request bypasses the response cache, which would otherwise consume
+        the body before it could be streamed.
 
         Args:
-            id (str): The unique identifier for the cryptocurrency to validate.
+            url(str): The API endpoint URL to send the GET request to. Its response must be a JSON array.
 
-        Returns:
-            bool: True if the cryptocurrency ID exists in the supported list; otherwise, raises ValueError.
+        Yields:
+            dict: Each element of the JSON array, parsed one at a time.
 
         Raises:
-            ValueError: If the provided cryptocurrency ID does not exist in the supported list.
+            HTTPError: If the HTTP request returns an unsuccessful status code.
+            JSONDecodeError: If the response cannot be decoded as JSON.
+            RequestException: If a network-related error occurs or the request fails for another reason.
         """
-        for currency in self.supported_crypto_currencies:
-            if currency["id"] == id:
-                return True
-        raise ValueError(f"Provided cryptocurrency ID '{id}' does not exist in supported list.")
+        try:
+            with self._session.cache_disabled():
+                response = self._session.get(url, stream=True)
+            with response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                yield from ijson.items(response.raw, "item")
+        except HTTPError:
+            raise HTTPError(
+                f"HTTP request failed with status code {response.status_code} for URL: {url}", response=response
+            )
+        except ijson.JSONError:
+            raise JSONDecodeError(f"Response from {url} could not be decoded as JSON.", "", 0)
+        except RequestException as e:
+            raise type(e)(f"Request failed: {e} for URL: {url}", request=e.request, response=e.response)
+        except Urllib3Error as e:
+            raise RequestException(f"Request failed: {e} for URL: {url}")
 
+    @_api_errors
     def get_supported_currencies(self) -> list[str]:
         """
         Fetches a list of supported fiat currencies from the CoinGecko API.
@@ -91,43 +488,29 @@ class CryptoHandler:
             JSONDecodeError: If the response cannot be decoded as JSON.
             RequestException: If a network-related error occurs or the request fails for another reason.
         """
-        try:
-            url = "https://api.coingecko.com/api/v3/simple/supported_vs_currencies"
-            supported_currencies = self._api_request(url=url)
-            return supported_currencies
-        except HTTPError:
-            raise HTTPError("HTTP error occurred")
-        except JSONDecodeError:
-            raise JSONDecodeError("JSON decode error occurred")
-        except RequestException as e:
-            raise RequestException(f"Request error occurred: {e}")
+        supported_currencies = self._api_request(url=URL_SUPPORTED_CURRENCIES)
+        return supported_currencies
 
-    def get_crypto_currencies(self) -> list[dict]:
+    @_api_errors
+    def get_crypto_currencies(self) -> CoinList:
         """
         Fetches a list of all supported cryptocurrencies, providing basic information including coin ID, name, and symbol.
 
         This method sends an API request to CoinGecko to retrieve an updated list of all supported coins on the platform.
-        The data returned includes the coin's unique identifier (ID), name, and symbol.
+        The response is parsed as a stream and each coin is reduced to its ID, name, and symbol as it arrives.
 
         Returns:
-            list[dict]: A list of dictionaries, each containing 'id', 'name', and 'symbol' for supported cryptocurrencies.
+            CoinList: The IDs, names, and symbols of all supported cryptocurrencies as parallel tuples.
 
         Raises:
             HTTPError: If the HTTP request returns an unsuccessful status code.
             JSONDecodeError: If the response cannot be decoded as JSON.
             RequestException: If a network-related error occurs or the request fails for another reason.
         """
-        try:
-            url = "https://api.coingecko.com/api/v3/coins/list"
-            crypto_currencies = self._api_request(url=url)
-            return crypto_currencies
-        except HTTPError:
-            raise HTTPError("HTTP error occurred")
-        except JSONDecodeError:
-            raise JSONDecodeError("JSON decode error occurred")
-        except RequestException as e:
-            raise RequestException(f"Request error occurred: {e}")
+        crypto_currencies = CoinList.from_coins(self._api_stream_items(url=URL_COINS_LIST))
+        return crypto_currencies
 
+    @_api_errors
     def get_crypto_currencies_detailed(self, base_currency="usd") -> list[Dict]:
         """
         Fetches detailed market data for cryptocurrencies, including price, market cap, and trading volume.
@@ -150,20 +533,12 @@ class CryptoHandler:
             JSONDecodeError: If the response cannot be decoded as JSON.
             RequestException: If a network-related error occurs or the request fails for another reason.
         """
-        try:
-            if base_currency in self.supported_currencies:
-                url = f"https://api.coingecko.com/api/v3/coins/markets?vs_currency={base_currency}"
-            else:
-                raise ValueError(f"Unsupported currency provided: {base_currency}")
-            crypto_currencies = self._api_request(url=url)
-            return crypto_currencies
-        except HTTPError:
-            raise HTTPError("HTTP error occurred")
-        except JSONDecodeError:
-            raise JSONDecodeError("JSON decode error occurred")
-        except RequestException as e:
-            raise RequestException(f"Request error occurred: {e}")
+        if base_currency not in self.supported_currencies:
+            raise ValueError(f"Unsupported currency provided: {base_currency}")
+        crypto_currencies = self._api_request(url=URL_MARKETS, params={"vs_currency": base_currency})
+        return crypto_currencies
 
+    @_api_errors
     def get_specific_crypto(self, id: str, base_currency: str = "usd") -> Dict[str, Any]:
         """
         Fetches the current price and market-related data for a specific cryptocurrency in a specified base currency.
@@ -187,21 +562,41 @@ class CryptoHandler:
             JSONDecodeError: If the response cannot be decoded as JSON.
             RequestException: If a network-related error occurs or the request fails for another reason.
         """
-        try:
-            self._is_valid_crypto_id(id)
-            if base_currency in self.supported_currencies:
-                url = "https://api.coingecko.com/api/v3/simple/price?ids=bitcoin&vs_currencies=usd"
-            else:
-                raise ValueError(f"Unsupported currency provided: {base_currency}")
-            coin_data = self._api_request(url=url)
-            return coin_data
-        except HTTPError:
-            raise HTTPError("HTTP error occurred")
-        except JSONDecodeError:
-            raise JSONDecodeError("JSON decode error occurred")
-        except RequestException as e:
-            raise RequestException(f"Request error occurred: {e}")
+        self._is_valid_crypto_id(id)
+        if base_currency not in self.supported_currencies:
+            raise ValueError(f"Unsupported currency provided: {base_currency}")
+        coin_data = self._api_request(url=URL_SIMPLE_PRICE, params={"ids": id, "vs_currencies": base_currency})
+        return coin_data
+
+    @_api_errors
+    def get_specific_cryptos(self, ids: list[str], base_currency: str = "usd") -> list[Dict]:
+        """
+        Fetches market data for several cryptocurrencies using as few API requests as possible.
+
+        Instead of one request per coin, the IDs are deduplicated and sent to the markets endpoint
+        in batches of up to 250 coins, so N coins cost ceil(N / 250) round trips.
+
+        Args:
+            ids (list[str]): The unique IDs of the cryptocurrencies to fetch.
+            base_currency (str): The fiat currency code to use for market data conversion (default: "usd").
+                Must be one of the supported currencies returned by the API, such as "usd", "eur", "gbp", etc.
 
+        Returns:
+            list[Dict]: A list of dictionaries containing market data for each requested cryptocurrency, including
+            'current_price', 'market_cap', 'total_volume', and other market-related metrics.
+
+        Raises:
+            ValueError: If a provided cryptocurrency ID or the base currency is not supported.
+            HTTPError: If the HTTP request returns an unsuccessful status code.
+            JSONDecodeError: If the response cannot be decoded as JSON.
+            RequestException: If a network-related error occurs or the request fails for another reason.
+        """
+        coins = []
+        for params in self._markets_batches(ids, base_currency):
+            coins.extend(self._api_request(url=URL_MARKETS, params=params))
+        return coins
+
+    @_api_errors
     def get_specific_crypto_detailed(self, id: str):
         """
         Fetches detailed information for a specific cryptocurrency by its unique ID.
@@ -218,18 +613,11 @@ class CryptoHandler:
             JSONDecodeError: If the response cannot be decoded as JSON.
             RequestException: If a network-related error occurs or the request fails for another reason.
         """
-        try:
-            self._is_valid_crypto_id(id)
-            url = f"https://api.coingecko.com/api/v3/coins/{id}"
-            coin_data = self._api_request(url=url)
-            return coin_data
-        except HTTPError:
-            raise HTTPError("HTTP error occurred")
-        except JSONDecodeError:
-            raise JSONDecodeError("JSON decode error occurred")
-        except RequestException as e:
-            raise RequestException(f"Request error occurred: {e}")
+        self._is_valid_crypto_id(id)
+        coin_data = self._api_request(url=URL_COIN_TMPL.format(id))
+        return coin_data
 
+    @_api_errors
     def get_global_data(self) -> dict:
         """
         Fetches global cryptocurrency market data, including total market cap, total volume, and more.
@@ -242,17 +630,10 @@ class CryptoHandler:
             JSONDecodeError: If the response cannot be decoded as JSON.
             RequestException: If a network-related error occurs or the request fails for another reason.
         """
-        try:
-            url = "https://api.coingecko.com/api/v3/global"
-            global_data = self._api_request(url=url)
-            return global_data
-        except HTTPError:
-            raise HTTPError("HTTP error occurred")
-        except JSONDecodeError:
-            raise JSONDecodeError("JSON decode error occurred")
-        except RequestException as e:
-            raise RequestException(f"Request error occurred: {e}")
+        global_data = self._api_request(url=URL_GLOBAL)
+        return global_data
 
+    @_api_errors
     def get_total_marketcap(self, base_currency: str = "usd") -> int:
         """
         Retrieves the total market capitalization of all cryptocurrencies in the specified base currency.
@@ -274,19 +655,13 @@ class CryptoHandler:
             JSONDecodeError: If the response cannot be decoded as JSON.
             RequestException: If a network-related error occurs or the request fails for another reason.
         """
-        try:
-            global_data = self.get_global_data()
-            if base_currency in self.supported_currencies:
-                return round(global_data["data"]["total_market_cap"][base_currency])
-            else:
-                raise ValueError(f"Unsupported currency provided: {base_currency}")
-        except HTTPError:
-            raise HTTPError("HTTP error occurred")
-        except JSONDecodeError:
-            raise JSONDecodeError("JSON decode error occurred")
-        except RequestException as e:
-            raise RequestException(f"Request error occurred: {e}")
+        global_data = self.get_global_data()
+        if base_currency in self.supported_currencies:
+            return round(global_data["data"]["total_market_cap"][base_currency])
+        else:
+            raise ValueError(f"Unsupported currency provided: {base_currency}")
 
+    @_api_errors
     def get_total_volume(self, base_currency: str = "usd") -> int:
         """
         Retrieves the total 24-hour trading volume of all cryptocurrencies in the specified base currency.
@@ -308,15 +683,8 @@ class CryptoHandler:
             JSONDecodeError: If the response cannot be decoded as JSON.
             RequestException: If a network-related error occurs or the request fails for another reason.
         """
-        try:
-            global_data = self.get_global_data()
-            if base_currency in self.supported_currencies:
-                return round(global_data["data"]["total_volume"][base_currency])
-            else:
-                raise ValueError(f"Unsupported currency provided: {base_currency}")
-        except HTTPError:
-            raise HTTPError("HTTP error occurred")
-        except JSONDecodeError:
-            raise JSONDecodeError("JSON decode error occurred")
-        except RequestException as e:
-            raise RequestException(f"Request error occurred: {e}")
+        global_data = self.get_global_data()
+        if base_currency in self.supported_currencies:
+            return round(global_data["data"]["total_volume"][base_currency])
+        else:
+            raise ValueError(f"Unsupported currency provided: {base_currency}")
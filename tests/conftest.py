@@ -0,0 +1,92 @@
+import gzip
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import orjson
+import pytest
+
+import cryptohandler
+
+
+class _Route:
+    def __init__(self, body=b"", status=200, headers=None, gzip_body=False, delay=0):
+        self.body = body
+        self.delay = delay
+        self.status = status
+        self.headers = headers or {}
+        self.gzip_body = gzip_body
+        self.hits = 0
+
+
+class LocalServer:
+    """
+    Minimal HTTP server standing in for the CoinGecko API; routes are registered per path.
+    """
+
+    def __init__(self):
+        self.routes: dict[str, _Route] = {}
+        routes = self.routes
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                route = routes.get(self.path.split("?", 1)[0])
+                if route is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                route.hits += 1
+                if route.delay:
+                    time.sleep(route.delay)
+                body = gzip.compress(route.body) if route.gzip_body else route.body
+                self.send_response(route.status)
+                self.send_header("Content-Type", "application/json")
+                if route.gzip_body:
+                    self.send_header("Content-Encoding", "gzip")
+                for name, value in route.headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def add(self, path, payload=None, **kwargs) -> _Route:
+        body = kwargs.pop("body", None)
+        if body is None:
+            body = orjson.dumps(payload)
+        route = _Route(body=body, **kwargs)
+        self.routes[path] = route
+        return route
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def server(monkeypatch, tmp_path):
+    """
+    Starts a local API server and points every CryptoHandler endpoint and cache at it.
+    """
+    local = LocalServer()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(cryptohandler, "CACHE_DIR", str(tmp_path))
+    for name in ("URL_SUPPORTED_CURRENCIES", "URL_COINS_LIST", "URL_MARKETS", "URL_SIMPLE_PRICE", "URL_GLOBAL"):
+        monkeypatch.setattr(cryptohandler, name, getattr(cryptohandler, name).replace(cryptohandler.API_BASE_URL, local.url))
+    monkeypatch.setattr(cryptohandler, "URL_COIN_TMPL", local.url + "/coins/{}")
+    host = local.url.removeprefix("http://")
+    monkeypatch.setattr(
+        cryptohandler,
+        "_CACHE_EXPIRATIONS",
+        {pattern.replace("api.coingecko.com/api/v3", host): ttl for pattern, ttl in cryptohandler._CACHE_EXPIRATIONS.items()},
+    )
+    yield local
+    local.close()
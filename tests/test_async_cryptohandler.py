@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+import requests
+from requests.exceptions import HTTPError
+
+import async_cryptohandler
+import cryptohandler
+from async_cryptohandler import AsyncCryptoHandler
+
+
+@pytest.fixture
+def async_server(server, monkeypatch):
+    """
+    Points the endpoint URLs imported by async_cryptohandler at the local server.
+    """
+    for name in ("URL_SUPPORTED_CURRENCIES", "URL_COINS_LIST", "URL_MARKETS", "URL_SIMPLE_PRICE", "URL_GLOBAL", "URL_COIN_TMPL"):
+        monkeypatch.setattr(async_cryptohandler, name, getattr(cryptohandler, name))
+    return server
+
+
+def test_create_without_api_key(async_server, monkeypatch):
+    monkeypatch.setattr(async_cryptohandler, "coingecko_api_key", None)
+    async_server.add("/simple/supported_vs_currencies", ["usd"])
+    async_server.add("/coins/list", [{"id": "bitcoin", "symbol": "btc", "name": "Bitcoin"}])
+
+    async def run():
+        async with await AsyncCryptoHandler.create() as handler:
+            return handler.get_coin_info("bitcoin")
+
+    assert asyncio.run(run()) == ("bitcoin", "Bitcoin", "btc")
+
+
+@pytest.fixture
+def coin_server(async_server):
+    async_server.add("/simple/supported_vs_currencies", ["usd"])
+    async_server.add("/coins/list", [{"id": "bitcoin", "symbol": "btc", "name": "Bitcoin"}])
+    return async_server
+
+
+def test_identical_concurrent_requests_share_one_fetch(coin_server):
+    route = coin_server.add("/coins/bitcoin", {"id": "bitcoin"}, delay=0.2)
+
+    async def run():
+        async with await AsyncCryptoHandler.create() as handler:
+            results = await asyncio.gather(*[handler.get_specific_crypto_detailed("bitcoin") for _ in range(5)])
+            return results, handler._inflight
+
+    results, inflight = asyncio.run(run())
+    assert route.hits == 1
+    assert all(result == {"id": "bitcoin"} for result in results)
+    assert inflight == {}
+
+
+def test_cancelling_one_waiter_does_not_cancel_the_shared_fetch(coin_server):
+    route = coin_server.add("/coins/bitcoin", {"id": "bitcoin"}, delay=0.2)
+
+    async def run():
+        async with await AsyncCryptoHandler.create() as handler:
+            waiters = [asyncio.ensure_future(handler.get_specific_crypto_detailed("bitcoin")) for _ in range(3)]
+            await asyncio.sleep(0.05)
+            waiters[0].cancel()
+            results = await asyncio.gather(*waiters[1:])
+            return waiters[0].cancelled(), results, handler._inflight
+
+    cancelled, results, inflight = asyncio.run(run())
+    assert cancelled
+    assert results == [{"id": "bitcoin"}, {"id": "bitcoin"}]
+    assert route.hits == 1
+    assert inflight == {}
+
+
+def test_http_errors_carry_a_requests_response(coin_server):
+    coin_server.add("/global", {"error": "boom"}, status=500)
+
+    async def run():
+        async with await AsyncCryptoHandler.create() as handler:
+            await handler.get_global_data()
+
+    with pytest.raises(HTTPError) as excinfo:
+        asyncio.run(run())
+    response = excinfo.value.response
+    assert isinstance(response, requests.Response)
+    assert response.status_code == 500
+    assert response.json() == {"error": "boom"}
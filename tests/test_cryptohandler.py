@@ -0,0 +1,185 @@
+import gzip
+import os
+import time
+from email.utils import formatdate
+
+import orjson
+import pytest
+import requests
+from requests.exceptions import ConnectionError, HTTPError, JSONDecodeError, RequestException
+
+import cryptohandler
+from cryptohandler import CoinList, CryptoHandler, RateLimitedAdapter
+
+COINS = [
+    {"id": "bitcoin", "symbol": "btc", "name": "Bitcoin"},
+    {"id": "ethereum", "symbol": "eth", "name": "Ethereum"},
+]
+
+
+@pytest.mark.parametrize("gzip_body", [True, False])
+def test_get_crypto_currencies_streams_coin_list_repeatedly(server, gzip_body):
+    server.add("/coins/list", COINS, gzip_body=gzip_body)
+    expected = CoinList(("bitcoin", "ethereum"), ("Bitcoin", "Ethereum"), ("btc", "eth"))
+
+    with CryptoHandler() as handler:
+        assert handler.get_crypto_currencies() == expected
+        assert handler.get_crypto_currencies() == expected
+
+
+def test_get_crypto_currencies_reports_undecodable_body_as_request_exception(server):
+    server.add("/coins/list", body=b"not gzip data", headers={"Content-Encoding": "gzip"})
+
+    with CryptoHandler() as handler, pytest.raises(RequestException):
+        handler.get_crypto_currencies()
+
+
+def test_api_request_reuses_parsed_body_for_unchanged_etag(server):
+    route = server.add("/global", {"data": {}}, headers={"ETag": '"v1"'})
+
+    with CryptoHandler() as handler:
+        first = handler.get_global_data()
+        assert handler.get_global_data() is first
+    assert route.hits == 2
+
+
+def test_api_request_bounds_etag_cache(server, monkeypatch):
+    monkeypatch.setattr(cryptohandler, "ETAG_CACHE_SIZE", 2)
+    for id in ("a", "b", "c"):
+        server.add(f"/coins/{id}", {"id": id}, headers={"ETag": f'"{id}"'})
+
+    with CryptoHandler() as handler:
+        for id in ("a", "b", "c"):
+            handler._api_request(url=cryptohandler.URL_COIN_TMPL.format(id))
+        assert list(handler._etag_cache) == [cryptohandler.URL_COIN_TMPL.format(id) for id in ("b", "c")]
+
+
+def test_get_specific_cryptos_batches_unique_ids(server, monkeypatch):
+    monkeypatch.setattr(cryptohandler, "MARKETS_MAX_IDS", 1)
+    server.add("/simple/supported_vs_currencies", ["usd"])
+    server.add("/coins/list", COINS)
+    markets = server.add("/coins/markets", [{"id": "coin"}])
+
+    with CryptoHandler() as handler:
+        coins = handler.get_specific_cryptos(["bitcoin", "ethereum", "bitcoin"])
+        with pytest.raises(ValueError, match="dogecoin"):
+            handler.get_specific_cryptos(["bitcoin", "dogecoin"])
+
+    assert coins == [{"id": "coin"}, {"id": "coin"}]
+    assert markets.hits == 2
+
+
+def test_exhausted_retries_raise_http_error(server, monkeypatch):
+    monkeypatch.setattr(cryptohandler, "_RETRY", cryptohandler._RETRY.new(total=1, backoff_factor=0))
+    route = server.add("/global", {}, status=503)
+
+    with CryptoHandler() as handler:
+        handler._session.mount("http://", handler._session.get_adapter("https://"))
+        with pytest.raises(HTTPError):
+            handler.get_global_data()
+    assert route.hits == 2
+
+
+def test_supported_crypto_currencies_reuses_saved_coin_list(server):
+    route = server.add("/coins/list", COINS)
+
+    with CryptoHandler() as handler:
+        assert handler.get_coin_info("ethereum") == ("ethereum", "Ethereum", "eth")
+    with CryptoHandler() as handler:
+        assert handler.get_coin_info("bitcoin") == ("bitcoin", "Bitcoin", "btc")
+    assert route.hits == 1
+
+
+def test_saved_coin_list_with_future_timestamp_is_ignored(server):
+    with gzip.open(os.path.join(cryptohandler.CACHE_DIR, cryptohandler.COINS_LIST_CACHE_FILE), "wb") as f:
+        f.write(orjson.dumps([time.time() + 3600, ["stale"], ["Stale"], ["stl"]]))
+    server.add("/coins/list", COINS)
+
+    with CryptoHandler() as handler:
+        assert handler.supported_crypto_currencies.ids == ("bitcoin", "ethereum")
+
+
+def test_nested_api_errors_keep_one_prefix_and_the_response(server):
+    server.add("/simple/supported_vs_currencies", ["usd"])
+    server.add("/global", {}, status=500)
+
+    with CryptoHandler() as handler, pytest.raises(HTTPError) as excinfo:
+        handler.get_total_marketcap()
+
+    message = str(excinfo.value)
+    assert message.startswith("get_total_marketcap: HTTP error occurred: ")
+    assert "get_global_data" not in message
+    assert excinfo.value.response.status_code == 500
+
+
+def test_connection_errors_keep_their_type(server, monkeypatch):
+    monkeypatch.setattr(cryptohandler, "URL_GLOBAL", "http://127.0.0.1:1/global")
+
+    with CryptoHandler() as handler, pytest.raises(ConnectionError, match="^get_global_data: Request error occurred"):
+        handler.get_global_data()
+
+
+def test_invalid_json_raises_json_decode_error(server):
+    server.add("/global", body=b"{not json")
+
+    with CryptoHandler() as handler, pytest.raises(JSONDecodeError, match="^get_global_data: JSON decode error"):
+        handler.get_global_data()
+
+
+def _rate_limited_response(**headers):
+    response = requests.Response()
+    response.headers.update(headers)
+    return response
+
+
+@pytest.mark.parametrize(
+    "retry_after, expected_delay",
+    [
+        ("30", 30),
+        ("http-date", 120),
+        (None, cryptohandler.RATE_LIMIT_WINDOW),
+    ],
+)
+def test_update_rate_state_reads_retry_after(retry_after, expected_delay):
+    adapter = RateLimitedAdapter()
+    headers = {"X-RateLimit-Remaining": "1"}
+    if retry_after == "http-date":
+        retry_after = formatdate(time.time() + 120, usegmt=True)
+    if retry_after is not None:
+        headers["Retry-After"] = retry_after
+
+    adapter._update_rate_state(_rate_limited_response(**headers))
+
+    assert adapter._rate_state["remaining"] == 1
+    assert adapter._rate_state["resume_at"] - time.monotonic() == pytest.approx(expected_delay, abs=2)
+
+
+def test_wait_for_rate_limit_sleeps_below_threshold(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(cryptohandler.time, "sleep", sleeps.append)
+    adapter = RateLimitedAdapter()
+
+    adapter._update_rate_state(_rate_limited_response(**{"X-RateLimit-Remaining": "100"}))
+    adapter._wait_for_rate_limit()
+    assert sleeps == []
+
+    adapter._update_rate_state(_rate_limited_response(**{"X-RateLimit-Remaining": "1", "Retry-After": "30"}))
+    adapter._wait_for_rate_limit()
+    assert sleeps == [pytest.approx(30, abs=2)]
+
+    adapter._wait_for_rate_limit()
+    assert len(sleeps) == 1
+
+
+def test_cached_responses_are_not_throttled(server, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(cryptohandler.time, "sleep", sleeps.append)
+    route = server.add("/simple/supported_vs_currencies", ["usd"], headers={"X-RateLimit-Remaining": "1"})
+
+    with CryptoHandler() as handler:
+        handler._session.mount("http://", handler._session.get_adapter("https://"))
+        handler.get_supported_currencies()
+        handler.get_supported_currencies()
+
+    assert route.hits == 1
+    assert sleeps == []